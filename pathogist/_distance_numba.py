@@ -0,0 +1,72 @@
+import numba
+from numba import types
+from numba.extending import intrinsic
+
+@intrinsic
+def popcount64(typingctx, x):
+    '''
+    Returns the number of set bits of a 64-bit word, as the LLVM ctpop intrinsic, which is compiled
+    to a single POPCNT instruction where the CPU supports it.
+    '''
+    if x != types.uint64:
+        return None
+    def codegen(context, builder, signature, args):
+        return builder.ctpop(args[0])
+    return types.uint64(types.uint64), codegen
+
+@numba.njit(parallel=True, cache=True, boundscheck=False)
+def hamming_distances(codes, out):
+    '''
+    Given a 2-dimensional array of integer codes (one column per sample), fills out with the
+    pairwise hamming distances between the columns.
+    Columns are distributed over threads; each pair is only computed once and mirrored.
+    '''
+    num_positions = codes.shape[0]
+    num_samples = codes.shape[1]
+    for i in numba.prange(num_samples):
+        out[i,i] = 0
+        for j in range(i):
+            mismatches = 0
+            for p in range(num_positions):
+                if codes[p,i] != codes[p,j]:
+                    mismatches += 1
+            out[i,j] = mismatches
+            out[j,i] = mismatches
+
+@numba.njit(parallel=True, cache=True, boundscheck=False)
+def packed_hamming_distances(packed, out):
+    '''
+    Given a 2-dimensional array of 2-bit packed calls (one row per sample, 32 calls per 64-bit
+    word), fills out with the pairwise hamming distances between the rows.
+    The mismatches in a word are the set bits of (x | x >> 1) restricted to the low bit of every
+    call, where x is the XOR of the two words.
+    '''
+    num_samples = packed.shape[0]
+    num_words = packed.shape[1]
+    low_bits = numba.uint64(0x5555555555555555)
+    for i in numba.prange(num_samples):
+        out[i,i] = 0
+        for j in range(i):
+            mismatches = 0
+            for w in range(num_words):
+                x = packed[i,w] ^ packed[j,w]
+                mismatches += popcount64((x | (x >> numba.uint64(1))) & low_bits)
+            out[i,j] = mismatches
+            out[j,i] = mismatches
+
+@numba.njit(parallel=True, cache=True, boundscheck=False)
+def l1_distances(signals, out):
+    '''
+    Given a 2-dimensional array of signals (one row per sample), fills out with the pairwise L1
+    distances between the rows.
+    '''
+    num_samples = signals.shape[0]
+    num_positions = signals.shape[1]
+    for i in numba.prange(num_samples):
+        out[i,i] = 0
+        for j in range(i):
+            distance = 0.0
+            for p in range(num_positions):
+                distance += abs(signals[i,p] - signals[j,p])
+            out[i,j] = distance
+            out[j,i] = distance
@@ -4,7 +4,12 @@ import sklearn.metrics
 import sklearn.metrics.cluster
 import logging
 import sys
+import os
 import gc
+import functools
+import hashlib
+import pickle
+import tempfile
 import random
 import itertools
 import pandas
@@ -111,8 +116,12 @@ def processProblem(Distances, all_constraints, start_solution=None):
     gc.collect()
     #if not presolve:
     if start_solution is not None:
-        start_vector = [start_solution[i, j] for i, j in itertools.combinations(range(N), 2)]
-        my_prob.MIP_starts.add([range(len(start_vector)), start_vector], my_prob.MIP_starts.effort_level.solve_MIP) # CHANGE HERE!!
+        # Several warm starts may be given; CPLEX keeps the best feasible one
+        start_solutions = start_solution if isinstance(start_solution, list) else [start_solution]
+        upper_triangle = numpy.triu_indices(N, 1)
+        for solution in start_solutions:
+            start_vector = numpy.asarray(solution)[upper_triangle].tolist()
+            my_prob.MIP_starts.add([range(len(start_vector)), start_vector], my_prob.MIP_starts.effort_level.solve_MIP) # CHANGE HERE!!
 
     my_prob.parameters.preprocessing.presolve.set(0) # try without this also.
     my_prob.parameters.emphasis.memory.set(1)  # try without this also.
@@ -147,7 +156,7 @@ def processProblem(Distances, all_constraints, start_solution=None):
         for i,j,k in same_sign_triplets(Distances):
             a, b, c = sorted([solMatrix[i][j], solMatrix[i][k], solMatrix[j][k]])
             if c > a+b: # test triangle ineq.
-                logger.debug(" Constraint violated for triplet %s, %s and %s." % (i,j,k))
+                logger.debug(" Constraint violated for triplet %s, %s and %s.",i,j,k)
                 violated = True
                 my_prob.linear_constraints.add(rhs = [0,0,0], senses = ["G","G","G"])
                 my_prob.linear_constraints.set_coefficients(zip([numConstraints]*3, [mapDict[i,j], mapDict[i,k], mapDict[j,k]], [1,1,-1]))
@@ -157,7 +166,8 @@ def processProblem(Distances, all_constraints, start_solution=None):
         if not violated:
             break
         logger.debug("Re-optimizing with all violated constraints added ...")
-    logger.debug("OBJ value: %.f" % my_prob.solution.get_objective_value())
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("OBJ value: %.f",my_prob.solution.get_objective_value())
     print(my_prob.solution.MIP.get_mip_relative_gap())
     print(my_prob.solution.MIP.get_best_objective())
     print("objective", my_prob.solution.get_objective_value())
@@ -368,7 +378,7 @@ def wait_until(somepredicate, timeout, period=0.25, *args, **kwargs):
         if somepredicate(*args, **kwargs):
             return True
         time.sleep(period)
-        logger.debug('waiting for ', must_end - time.time())
+        logger.debug('waiting for %s', must_end - time.time())
     return False
 
 def createCluster(v, m, pi, pi_dict, G, clusterIDs):
@@ -384,7 +394,7 @@ def isCenter(v, pi, pi_dict, G, clusterIDs, is_center_dict):
         if pi_dict[u] < pi_dict[v]:
             if G[u, v] == 1:
                 if not wait_until(lambda x, idx: x[idx] != math.inf, 5, 0.1, clusterIDs, u):
-                    logger.debug('Timeout!', u, clusterIDs[u], clusterIDs[u] != math.inf)
+                    logger.debug('Timeout! %s %s %s', u, clusterIDs[u], clusterIDs[u] != math.inf)
                 if isCenter(u, pi, pi_dict, G, clusterIDs, is_center_dict):
                     is_center_dict[v] = 0
                     return 0
@@ -489,7 +499,84 @@ def make_clustering(sol_matrix):
 
     return clustering
 
-def correlation(distance_matrix, threshold, all_constraints=False, method='ILP'):
+def clustering_to_start_solution(clustering, samples):
+    '''
+    Returns the 0/1 ILP solution matrix (0 when two samples share a cluster) corresponding to a
+    clustering, with rows and columns in the order of samples.
+    @param clustering: a Pandas DataFrame indexed by sample names, whose first column holds cluster
+                       assignments
+    @param samples: the sample names, in the order of the distance matrix
+    '''
+    labels = clustering.iloc[:,0].loc[samples].values
+    return (labels[:,None] != labels[None,:]).astype(float)
+
+# Version of the correlation clustering algorithms, part of the key of cached clusterings. Increase
+# it whenever a change to correlation (or the solvers it uses) changes its results, so that stale
+# cached clusterings are not used.
+CORRELATION_CACHE_VERSION = 1
+
+def correlation_cache_dir():
+    '''
+    Returns the directory where correlation clusterings are cached: pathogist/corr under
+    $XDG_CACHE_HOME (~/.cache by default), or None if the PATHOGIST_NO_CACHE environment variable
+    is set to anything but an empty string, which disables the cache.
+    '''
+    if os.environ.get('PATHOGIST_NO_CACHE'):
+        return None
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(cache_home, 'pathogist', 'corr')
+
+def _disk_cache(function):
+    '''
+    Decorator caching correlation clustering results on disk, in correlation_cache_dir(), keyed by
+    a hash of CORRELATION_CACHE_VERSION, the pandas version, the distance matrix, its labels, the
+    threshold, all_constraints and method. The warm start clusterings do not change the problem, so they are
+    not part of the key.
+    '''
+    @functools.wraps(function)
+    def wrapper(distance_matrix, threshold, all_constraints=False, method='ILP', start_clusterings=None):
+        cache_dir = correlation_cache_dir()
+        if cache_dir is None:
+            return function(distance_matrix, threshold, all_constraints, method, start_clusterings)
+        values = numpy.ascontiguousarray(distance_matrix.values)
+        # BLAKE2b is only available from Python 3.6
+        digest = getattr(hashlib, 'blake2b', hashlib.sha256)()
+        digest.update(values.tobytes())
+        digest.update(repr((CORRELATION_CACHE_VERSION, pandas.__version__, str(values.dtype), values.shape,
+                            list(distance_matrix.index), list(distance_matrix.columns),
+                            float(threshold), bool(all_constraints), method)).encode())
+        cache_path = os.path.join(cache_dir, digest.hexdigest() + '.pkl')
+        try:
+            cache_file = open(cache_path, 'rb')
+        except OSError:
+            pass
+        else:
+            try:
+                with cache_file:
+                    clustering = pickle.load(cache_file)
+                logger.debug(" Using cached clustering %s",cache_path)
+                return clustering
+            except Exception:
+                # Unreadable entry, e.g. truncated or pickled by an incompatible library version
+                logger.debug(" Removing unreadable cached clustering %s",cache_path)
+                try:
+                    os.remove(cache_path)
+                except OSError:
+                    pass
+        clustering = function(distance_matrix, threshold, all_constraints, method, start_clusterings)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir)
+            with os.fdopen(fd, 'wb') as tmp_file:
+                pickle.dump(clustering, tmp_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            logger.debug(" Could not cache clustering at %s",cache_path)
+        return clustering
+    return wrapper
+
+@_disk_cache
+def correlation(distance_matrix, threshold, all_constraints=False, method='ILP', start_clusterings=None):
     '''
     Given a distance matrix as a Pandas DataFrame and a distance threshold, solve a correlation
     clustering problem instance LP problem and then apply the Chawla et al. 2015 rounding algorithm,
@@ -500,6 +587,9 @@ def correlation(distance_matrix, threshold, all_constraints=False, method='ILP')
     @param all_constraints: boolean indicating whether all triangle inequality constraints should be
                             used in the CPLEX problem
     @param method: the method that is used to solve the correlation clustering, which is one of these: 'C4', 'ILP', 'C4+ILP'
+    @param start_clusterings: optional list of clusterings of the same samples (e.g. solutions of
+                              related problems) used, along with the C4 clustering, to warm start
+                              the ILP
     @rvalue clustering: the approximate optimal clustering represented as a Pandas DataFrame
     '''
     threshold = float(threshold)
@@ -525,13 +615,10 @@ def correlation(distance_matrix, threshold, all_constraints=False, method='ILP')
         
         c4_clustering = c4_correlation(distance_matrix, threshold)
         indexes = distance_matrix.index
-        N = distance_matrix.shape[0]
-        start_solution = numpy.ones((N, N))
-        numpy.fill_diagonal(start_solution, 0)
-        for i, j in itertools.combinations(range(N), 2):
-                if c4_clustering['Cluster'].loc[indexes[i]] == c4_clustering['Cluster'].loc[indexes[j]]:
-                    start_solution[i, j] = 0
-                    start_solution[j, i] = 0
+        start_solution = [clustering_to_start_solution(c4_clustering, indexes)]
+        for start_clustering in (start_clusterings or []):
+            if set(indexes) <= set(start_clustering.index):
+                start_solution.append(clustering_to_start_solution(start_clustering, indexes))
 
         sol_matrix = processProblem(weight_matrix.values, all_constraints, start_solution)
         #sol_matrix = processProblem(weight_matrix.values, all_constraints)
@@ -801,7 +888,10 @@ def consensus(distances,clusterings,fine_clusterings,weight_matrix=None, all_con
     if weight_matrix is None:
         #clustering_matrices = {key: cluster_vector_to_matrix(clusterings[key]) for key in clusterings.keys()}
         weight_matrix = construct_consensus_weights(clusterings,distances,fine_clusterings)
-    clustering = correlation(-weight_matrix, 0, all_constraints, method)
+    # The consensus problem is on the same samples as the input clusterings, which are good
+    # starting points for the ILP
+    clustering = correlation(-weight_matrix, 0, all_constraints, method,
+                             start_clusterings=list(clusterings.values()))
     '''
     samples = weight_matrix.columns.values
     
@@ -819,7 +909,7 @@ def consensus(distances,clusterings,fine_clusterings,weight_matrix=None, all_con
                                ,key=lambda x:x[0])
     # Turn the list of clusters into pandas data frame
     clustering = clustering_to_pandas(list_of_clusters,samples)
-    logger.info(" Done! %d clusters found" % clustering['Cluster'].values.max())
+    logger.info(" Done! %d clusters found",clustering['Cluster'].values.max())
     '''    
     clustering.columns = ['Consensus']
     return clustering
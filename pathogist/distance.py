@@ -1,6 +1,7 @@
 import logging
 import sys
 import itertools
+import functools
 import numpy
 import pandas
 ''' These imports are for the suffix array hamming distance function. Not used.
@@ -13,6 +14,31 @@ import time
 
 logger = logging.getLogger(__name__)
 
+# Above this many calls (samples times positions), distances are computed with the parallel numba
+# kernels if numba is installed
+NUMBA_THRESHOLD = 5 * 10**7
+
+# Number of calls one-hot encoded at a time when computing distances without numba
+ONE_HOT_BLOCK_CALLS = 2**22
+
+@functools.lru_cache(maxsize=None)
+def _numba_kernels():
+    '''
+    Returns the module of numba kernels, or None if numba is not installed. Importing numba is
+    slow, so this is only done the first time a kernel is needed.
+    '''
+    try:
+        import pathogist._distance_numba
+    except ImportError:
+        return None
+    return pathogist._distance_numba
+
+# Masks used to count mismatching calls in 64-bit words holding 32 2-bit calls
+LOW_BITS_MASK = numpy.uint64(0x5555555555555555)
+PAIRS_MASK = numpy.uint64(0x3333333333333333)
+NIBBLES_MASK = numpy.uint64(0x0f0f0f0f0f0f0f0f)
+BYTES_SUM = numpy.uint64(0x0101010101010101)
+
 def hamming_distance(calls1,calls2):
     '''
     Given two numpy 1-dimensional arrays calls1, calls2 of the same shape, returns the hamming distance.
@@ -29,21 +55,34 @@ def l1_norm(calls1,calls2):
     '''
     return numpy.linalg.norm(calls1-calls2,ord=1)
 
+def upper_triangle_distances(rows,row_distances,dtype):
+    '''
+    Given a 2-dimensional numpy array (one row per sample) and a function returning the distances
+    from one row to each row of a block of rows, returns the symmetric pairwise distance matrix.
+    Only the pairs above the diagonal are computed; the lower triangle is filled by mirroring.
+    '''
+    num_samples = rows.shape[0]
+    distances = numpy.zeros(shape=(num_samples,num_samples),dtype=dtype)
+    for i in range(num_samples - 1):
+        distances[i,i+1:] = row_distances(rows[i],rows[i+1:])
+    distances += distances.T
+    return distances
+
 def create_mlst_distance_matrix(calls):
     '''
     Given a dictionary of MLST calls (where sample names are keys to a vector), creates an MLST
     distance matrix represented as a Pandas Dataframe object.
     Distance: hamming distance
     '''
-    samples = calls.keys()
-    num_samples = len(samples)
-    logger.debug("Got " + str(num_samples) + " samples...")
-    distance_matrix = pandas.DataFrame(numpy.zeros(shape=(num_samples,num_samples),dtype=int),
-                                       index=samples,columns=samples,dtype=int)
-    for sample1,sample2 in itertools.combinations(samples,2):
-        distance_matrix[sample1][sample2] = hamming_distance(calls[sample1],calls[sample2])
-        distance_matrix[sample2][sample1] = distance_matrix[sample1][sample2]
-    return distance_matrix
+    samples,codes,num_values = encode_calls(calls)
+    logger.debug("Got %d samples...",len(samples))
+    if codes.size > NUMBA_THRESHOLD and _numba_kernels() is not None:
+        distances = numba_hamming_distances(codes,num_values)
+    else:
+        distances = upper_triangle_distances(codes,
+                                             lambda row,block: numpy.count_nonzero(block != row,axis=1),
+                                             int)
+    return pandas.DataFrame(distances,index=samples,columns=samples)
 
 def create_cnv_distance_matrix(calls):
     '''
@@ -51,14 +90,117 @@ def create_cnv_distance_matrix(calls):
     distance matrix represented as a Pandas Dataframe object.
     Distance: L1 norm
     '''
-    samples = calls.keys()
-    num_samples = len(samples)
-    distance_matrix = pandas.DataFrame(numpy.zeros(shape=(num_samples,num_samples),dtype=int),
-                                       index=samples,columns=samples,dtype=float)
-    for sample1,sample2 in itertools.combinations(samples,2):
-        distance_matrix[sample1][sample2] = l1_norm(calls[sample1],calls[sample2])
-        distance_matrix[sample2][sample1] = distance_matrix[sample1][sample2]
-    return distance_matrix
+    samples = list(calls.keys())
+    signals = numpy.array([calls[sample] for sample in samples],dtype=float)
+    if signals.size > NUMBA_THRESHOLD and _numba_kernels() is not None:
+        distances = numpy.empty(shape=(len(samples),len(samples)),dtype=float)
+        _numba_kernels().l1_distances(signals,distances)
+    else:
+        distances = upper_triangle_distances(signals,
+                                             lambda row,block: numpy.abs(block - row).sum(axis=1),
+                                             float)
+    return pandas.DataFrame(distances,index=samples,columns=samples)
+
+def encode_calls(calls):
+    '''
+    Given a dictionary of calls (where sample names are keys to vectors of the same length), returns
+    the list of samples, a 2-dimensional numpy array of integer codes, one row per sample, where
+    equal calls at a position share the same code, and the number of distinct codes.
+    Missing calls share a code of their own. Codes are stored in the smallest integer type holding
+    them (uint8 for e.g. base calls).
+    '''
+    samples = list(calls.keys())
+    stacked = numpy.array([calls[sample] for sample in samples])
+    if stacked.dtype.itemsize == 1 and stacked.dtype.kind in 'SbiuV':
+        # One byte per call (e.g. S1 base calls): map the bytes present to codes with a lookup table,
+        # without the int64 codes and object array of factorize
+        stacked = stacked.view(numpy.uint8)
+        present = numpy.zeros(256,dtype=bool)
+        present[stacked.ravel()] = True
+        num_values = int(present.sum())
+        table = (numpy.cumsum(present) - 1).astype(numpy.uint8)
+        return samples, table[stacked], num_values
+    if stacked.dtype.kind == 'S' and stacked.dtype.itemsize in (2,4,8):
+        # Hash fixed-width byte strings as integers rather than as Python objects
+        flat = stacked.ravel().view('u%d' % stacked.dtype.itemsize)
+    else:
+        flat = stacked.ravel()
+    # factorize hashes the calls, which is faster than sorting them with numpy.unique
+    codes,values = pandas.factorize(flat)
+    num_values = len(values)
+    missing = codes < 0
+    if missing.any():
+        codes[missing] = num_values
+        num_values += 1
+    code_type = numpy.uint8 if num_values <= 256 else numpy.int32
+    return samples, codes.astype(code_type).reshape(stacked.shape), num_values
+
+def numba_hamming_distances(codes,num_values):
+    '''
+    Given a 2-dimensional numpy array of integer codes (one row per sample), returns the matrix of
+    pairwise hamming distances between the rows, computed with the parallel numba kernel.
+    '''
+    num_samples = codes.shape[0]
+    distances = numpy.empty(shape=(num_samples,num_samples),dtype=int)
+    code_type = numpy.uint8 if num_values <= 256 else numpy.int32
+    _numba_kernels().hamming_distances(codes.T.astype(code_type,order='C'),distances)
+    return distances
+
+def one_hot_hamming_distances(codes,num_values):
+    '''
+    Given a 2-dimensional numpy array of integer codes (one row per sample), returns the matrix of
+    pairwise hamming distances between the rows.
+    The number of matching positions between two rows is the dot product of their one-hot encodings,
+    so the whole matrix is computed with one matrix product per distinct code. The positions are
+    encoded in blocks of about ONE_HOT_BLOCK_CALLS calls, which bounds the memory used.
+    '''
+    num_samples,num_positions = codes.shape
+    block = max(1,ONE_HOT_BLOCK_CALLS // max(1,num_samples))
+    matches = numpy.zeros(shape=(num_samples,num_samples),dtype=numpy.float64)
+    for start in range(0,num_positions,block):
+        block_codes = codes[:,start:start+block]
+        for value in range(num_values):
+            plane = (block_codes == value).astype(numpy.float64)
+            matches += plane.dot(plane.T)
+    return numpy.rint(num_positions - matches).astype(int)
+
+def pack_2bit(codes):
+    '''
+    Given a 2-dimensional numpy array of integer codes between 0 and 3 (one row per sample), packs
+    each row into 64-bit words holding 32 calls each. Rows are padded with zeros.
+    The calls are ORed into the words one slot at a time, so no 64-bit copy of the calls is made.
+    '''
+    num_samples,num_positions = codes.shape
+    num_words = -(-num_positions // 32)
+    packed = numpy.zeros(shape=(num_samples,num_words),dtype=numpy.uint64)
+    for slot in range(min(32,num_positions)):
+        slot_codes = codes[:,slot::32]
+        packed[:,:slot_codes.shape[1]] |= slot_codes.astype(numpy.uint64) << numpy.uint64(2 * slot)
+    return packed
+
+def popcount(words):
+    '''
+    Given a numpy array of 64-bit words, returns the total number of set bits along the last axis.
+    Uses numpy.bitwise_count when available, and the usual SWAR reduction otherwise.
+    '''
+    if hasattr(numpy,'bitwise_count'):
+        return numpy.bitwise_count(words).sum(axis=-1,dtype=numpy.int64)
+    words = words - ((words >> numpy.uint64(1)) & LOW_BITS_MASK)
+    words = (words & PAIRS_MASK) + ((words >> numpy.uint64(2)) & PAIRS_MASK)
+    words = (words + (words >> numpy.uint64(4))) & NIBBLES_MASK
+    return ((words * BYTES_SUM) >> numpy.uint64(56)).sum(axis=-1,dtype=numpy.int64)
+
+def packed_hamming_distances(packed):
+    '''
+    Given a 2-dimensional numpy array of 2-bit packed calls (one row per sample), returns the matrix
+    of pairwise hamming distances between the rows.
+    Two calls differ if either of their bits differ, so the mismatches in a word are the set bits of
+    (x | x >> 1) restricted to the low bit of every call, where x is the XOR of the two words.
+    '''
+    def row_distances(row,block):
+        xor = block ^ row
+        return popcount((xor | (xor >> numpy.uint64(1))) & LOW_BITS_MASK)
+    return upper_triangle_distances(packed,row_distances,int)
 
 def create_snp_distance_matrix(calls):
     '''
@@ -66,8 +208,22 @@ def create_snp_distance_matrix(calls):
     distance matrix represented as a Pandas Dataframe object.
     Distance: hamming distance
     '''
-    # Assume that the SNP distance matrix is created in the same was as the MLST distance matrix.
-    return create_mlst_distance_matrix(calls)
+    samples,codes,num_values = encode_calls(calls)
+    logger.debug("Got %d samples...",len(samples))
+    use_numba = codes.size > NUMBA_THRESHOLD and _numba_kernels() is not None
+    if num_values <= 4:
+        # Calls fit in 2 bits, e.g. plain A/C/G/T base calls
+        packed = pack_2bit(codes)
+        if use_numba:
+            distances = numpy.empty(shape=(len(samples),len(samples)),dtype=int)
+            _numba_kernels().packed_hamming_distances(packed,distances)
+        else:
+            distances = packed_hamming_distances(packed)
+    elif use_numba:
+        distances = numba_hamming_distances(codes,num_values)
+    else:
+        distances = one_hot_hamming_distances(codes,num_values)
+    return pandas.DataFrame(distances,index=samples,columns=samples)
 
 
 def create_spotype_distance_matrix(calls):
@@ -76,16 +232,8 @@ def create_spotype_distance_matrix(calls):
     distance matrix represented as a Pandas Dataframe object.
     Distance: hamming distance
     '''
-    samples = calls.keys()
-    num_samples = len(samples)
-    logger.debug("Got " + str(num_samples) + " samples...")
-    distance_matrix = pandas.DataFrame(numpy.zeros(shape=(num_samples,num_samples),dtype=int),
-                                       index=samples,columns=samples,dtype=int)
-
-    for sample1,sample2 in itertools.combinations(samples,2):
-        distance_matrix[sample1][sample2] = hamming_distance(calls[sample1],calls[sample2])
-        distance_matrix[sample2][sample1] = distance_matrix[sample1][sample2]
-    return distance_matrix
+    # Spoligotypes are binary vectors, so they are compared the same way as MLST calls.
+    return create_mlst_distance_matrix(calls)
 
 def create_spoligo_distance_matrix(calls):
     '''
@@ -20,12 +20,21 @@ def open_clustering_file(path):
     clustering = pandas.read_csv(path,header=0,index_col=0,sep='\t') 
     return clustering
 
-def open_distance_file(filename):
+def open_distance_file(filename,dtype=None):
     '''
     Reads distance matrix file represented in CSV format.
     Returns distance matrix as a pandas DataFrame matrix.
+    @param dtype: optional numpy dtype for the distances (e.g. numpy.float32 to halve the memory
+                  used by large matrices). By default the type is inferred from the file, so
+                  integer distances stay exact.
     '''
-    distance = pandas.read_csv(filename,header=0,index_col=0,sep='\t')
+    if dtype is not None:
+        # The distances are parsed as dtype directly, rather than converted from float64 afterwards.
+        # Only the distance columns are given the dtype, the first column holds the sample names.
+        columns = pandas.read_csv(filename,header=0,index_col=0,sep='\t',nrows=0).columns
+        dtype = {column: dtype for column in columns}
+    distance = pandas.read_csv(filename,header=0,index_col=0,sep='\t',engine='c',
+                               memory_map=True,low_memory=False,dtype=dtype)
     assert( distance.values.shape[0] == distance.values.shape[1] ),\
         "Distance matrix isn't square."
     return distance
@@ -207,20 +216,21 @@ def write_distance_matrix(distance_matrix,output_path):
     distance_matrix.to_csv(output_path,sep='\t')
 
 def assert_config(config):
-    # Makes sure the configuration file is formatted correctly
+    # Makes sure the configuration file is formatted correctly, raising a ValueError otherwise.
+    # Explicit checks are used rather than asserts, which are skipped when running with -O.
     #temp directory value assertion
-    assert os.path.isdir(config['temp']),\
-        "Temp value in the config file is not a real directory"
+    if not os.path.isdir(config['temp']):
+        raise ValueError("Temp value in the config file is not a real directory")
     #threads value assertion
-    assert isinstance(config['threads'], int) and config['threads'] > 0 , \
-        "Threads value in the config file must be an integer and greater than 0"
+    if not (isinstance(config['threads'], int) and config['threads'] > 0):
+        raise ValueError("Threads value in the config file must be an integer and greater than 0")
     #run section assertion
     run_genotyping_tools = False
     for tool in config['run']:
         if config['run'][tool] == 1:
            run_genotyping_tools = True
-        assert config['run'][tool] == 1 or config['run'][tool] == 0,\
-            "The value for the %s under the run section must be 0 or 1 to indicate to not run and run respectively." % tool
+        if not (config['run'][tool] == 1 or config['run'][tool] == 0):
+            raise ValueError("The value for the %s under the run section must be 0 or 1 to indicate to not run and run respectively." % tool)
     #genotyping section assertion
     for key in config['genotyping']:
         if key == "input_reads": # add assertions
@@ -230,138 +240,139 @@ def assert_config(config):
                     if run_genotyping_tools == False:
                         continue
                     else:
-                        assert reads_path != None,\
-                            "File location values in the %s section under genotyping section must exist when you are running genotyping tools." % type
+                        if reads_path == None:
+                            raise ValueError("File location values in the %s section under genotyping section must exist when you are running genotyping tools." % type)
                 else:
                     if run_genotyping_tools == False:
                         continue
                     else:
-                        assert os.path.isfile(reads_path),\
-                            "File location values in the %s section under genotyping section must exist." % type
+                        if not os.path.isfile(reads_path):
+                            raise ValueError("File location values in the %s section under genotyping section must exist." % type)
         # mentalist section assertion                        
         if key == "mentalist" and config['run'][key] == 1:
             #db_loc section assertion
             db_loc = False
             db_loc_count = 0
             for type in config['genotyping'][key]['db_loc']:
-                assert config['genotyping'][key]['db_loc'][type] == 1 or config['genotyping'][key]['db_loc'][type] == 0,\
-                    "The value for the %s under the db_loc section must be 0 or 1 to indicate where to locate mentalist db." % type
+                if not (config['genotyping'][key]['db_loc'][type] == 1 or config['genotyping'][key]['db_loc'][type] == 0):
+                    raise ValueError("The value for the %s under the db_loc section must be 0 or 1 to indicate where to locate mentalist db." % type)
                 if config['genotyping'][key]['db_loc'][type] == 1:
                     db_loc = True
                     db_loc_count += 1
-            assert db_loc_count == 1,\
-                "Choose only 1 of the options under db_loc for mentalist to obtain mlst database"
-            assert db_loc == True, \
-                "Choose 1 of the options under db_loc for mentalist to obtain mlst database by inputting 1"
+            if db_loc_count != 1:
+                raise ValueError("Choose only 1 of the options under db_loc for mentalist to obtain mlst database")
+            if db_loc != True:
+                raise ValueError("Choose 1 of the options under db_loc for mentalist to obtain mlst database by inputting 1")
             #local file section assertion
             if config['genotyping'][key]['db_loc']['local_file'] == 1:
-                assert config['genotyping']['mentalist']['local_file']['database'] != None,\
-                    "Database file value under mentalist section cannot be empty"
-                assert os.path.isfile(config['genotyping']['mentalist']['local_file']['database']),\
-                    "Database file value must mentalist section exist"
+                if config['genotyping']['mentalist']['local_file']['database'] == None:
+                    raise ValueError("Database file value under mentalist section cannot be empty")
+                if not os.path.isfile(config['genotyping']['mentalist']['local_file']['database']):
+                    raise ValueError("Database file value must mentalist section exist")
             # build_db assertion
             if config['genotyping'][key]['db_loc']['build_db'] == 1:
-                assert isinstance(config['genotyping'][key]['build_db']['options']['k'], int) and config['genotyping'][key]['build_db']['options']['k'] > 0,\
-                    "k value in build_db under mentalist must be an integer and greater than 0"
-                assert os.path.isfile(config['genotyping'][key]['build_db']['options']['fasta_files']),\
-                    "fasta_file value in build_db under mentalist must be a file path that exists"
-                assert os.path.isfile(config['genotyping'][key]['build_db']['options']['profile']),\
-                    "profile value in build_db under mentalist must be a file path that exists"
+                if not (isinstance(config['genotyping'][key]['build_db']['options']['k'], int) and config['genotyping'][key]['build_db']['options']['k'] > 0):
+                    raise ValueError("k value in build_db under mentalist must be an integer and greater than 0")
+                if not os.path.isfile(config['genotyping'][key]['build_db']['options']['fasta_files']):
+                    raise ValueError("fasta_file value in build_db under mentalist must be a file path that exists")
+                if not os.path.isfile(config['genotyping'][key]['build_db']['options']['profile']):
+                    raise ValueError("profile value in build_db under mentalist must be a file path that exists")
             # download_pubmlst assertion
             if config['genotyping'][key]['db_loc']['download_pubmlst'] == 1:
-                assert isinstance(config['genotyping'][key]['download_pubmlst']['options']['k'], int) and config['genotyping'][key]['download_pubmlst']['options']['k'] > 0,\
-                    "k value in download_pubmlst under mentalist must be an integer and greater than 0"
-                assert config['genotyping'][key]['download_pubmlst']['options']['scheme']!= None, \
-                    "Scheme cannot be none under download_mlst section"
+                if not (isinstance(config['genotyping'][key]['download_pubmlst']['options']['k'], int) and config['genotyping'][key]['download_pubmlst']['options']['k'] > 0):
+                    raise ValueError("k value in download_pubmlst under mentalist must be an integer and greater than 0")
+                if config['genotyping'][key]['download_pubmlst']['options']['scheme'] == None:
+                    raise ValueError("Scheme cannot be none under download_mlst section")
             # download_cgmlst assertion
             if config['genotyping'][key]['db_loc']['download_cgmlst'] == 1:
-                assert isinstance(config['genotyping'][key]['download_cgmlst']['options']['k'], int) and config['genotyping'][key]['download_cgmlst']['options']['k'] > 0,\
-                    "k value in download_cgmlst under mentalist must be an integer and greater than 0"
-                assert config['genotyping'][key]['download_cgmlst']['options']['scheme']!= None, \
-                    "Scheme cannot be none under download_cgmlst section"
+                if not (isinstance(config['genotyping'][key]['download_cgmlst']['options']['k'], int) and config['genotyping'][key]['download_cgmlst']['options']['k'] > 0):
+                    raise ValueError("k value in download_cgmlst under mentalist must be an integer and greater than 0")
+                if config['genotyping'][key]['download_cgmlst']['options']['scheme'] == None:
+                    raise ValueError("Scheme cannot be none under download_cgmlst section")
             # download_enterobase assertion
             if config['genotyping'][key]['db_loc']['download_enterobase'] == 1:            
-                assert isinstance(config['genotyping'][key]['download_enterobase']['options']['k'], int) and config['genotyping'][key]['download_enterobase']['options']['k'] > 0,\
-                    "k value in download_enterobase under mentalist must be an integer and greater than 0"
-                assert config['genotyping'][key]['download_enterobase']['options']['scheme']!= None, \
-                    "Scheme cannot be none under download_enterobase section"
-                assert config['genotyping'][key]['download_enterobase']['options']['type'] in ['cg', 'wg'],\
-                    "cg and wgs are the only values allowed in the type section of download_enterobase under mentalist"
+                if not (isinstance(config['genotyping'][key]['download_enterobase']['options']['k'], int) and config['genotyping'][key]['download_enterobase']['options']['k'] > 0):
+                    raise ValueError("k value in download_enterobase under mentalist must be an integer and greater than 0")
+                if config['genotyping'][key]['download_enterobase']['options']['scheme'] == None:
+                    raise ValueError("Scheme cannot be none under download_enterobase section")
+                if config['genotyping'][key]['download_enterobase']['options']['type'] not in ['cg', 'wg']:
+                    raise ValueError("cg and wgs are the only values allowed in the type section of download_enterobase under mentalist")
             # call assertions             
-            assert isinstance(config['genotyping'][key]['call']['options']['mutation_threshold'], int) and config['genotyping'][key]['call']['options']['mutation_threshold'] >= 0,\
-                "mutation_threshold value in call under mentalist must be an integer and greater than or equal to 0"
-            assert isinstance(config['genotyping'][key]['call']['options']['kt'], int) and config['genotyping'][key]['call']['options']['kt'] > 1,\
-                "kt value in call under mentalist must be an integer and greater than 0"
+            if not (isinstance(config['genotyping'][key]['call']['options']['mutation_threshold'], int) and config['genotyping'][key]['call']['options']['mutation_threshold'] >= 0):
+                raise ValueError("mutation_threshold value in call under mentalist must be an integer and greater than or equal to 0")
+            if not (isinstance(config['genotyping'][key]['call']['options']['kt'], int) and config['genotyping'][key]['call']['options']['kt'] > 1):
+                raise ValueError("kt value in call under mentalist must be an integer and greater than 0")
             if config['genotyping'][key]['call']['flags'] != None: 
                 for flag in config['genotyping'][key]['call']['flags']:
-                    assert flag in ['output_votes', 'output_special'], "output_votes and output_special are the only values allowed in the flags of call under mentalist"
+                    if flag not in ['output_votes', 'output_special']:
+                        raise ValueError("output_votes and output_special are the only values allowed in the flags of call under mentalist")
         # kwip assertions                    
         if key == "kwip" and config['run'][key] == 1:
             if config['genotyping'][key]['kwip_options'] != None:
                 if config['genotyping'][key]['kwip_options']['weights'] != None:
-                    assert os.path.isfile(config['genotyping'][key]['kwip_options']['weights']),\
-                        "Weights in the kwip section under genotyping section must exist."
+                    if not os.path.isfile(config['genotyping'][key]['kwip_options']['weights']):
+                        raise ValueError("Weights in the kwip section under genotyping section must exist.")
             if config['genotyping'][key]['kwip_flags'] != None:
                 for flag in config['genotyping'][key]['kwip_flags']:
-                    assert flag in ['unweighted', 'calc_weights'],\
-                        "unweighted and calc_weights are the only flags allowed in the kwip_flags section"
+                    if flag not in ['unweighted', 'calc_weights']:
+                        raise ValueError("unweighted and calc_weights are the only flags allowed in the kwip_flags section")
         # prince assertions                    
         if key == "prince" and config['run'][key] == 1:
             if config['genotyping'][key]['options'] != None:
                 if config['genotyping'][key]['options']['templates'] != None:
-                    assert os.path.isfile(config['genotyping'][key]['options']['templates']),\
-                        "Templates in the prince section under genotyping section must exist."
+                    if not os.path.isfile(config['genotyping'][key]['options']['templates']):
+                        raise ValueError("Templates in the prince section under genotyping section must exist.")
         # snippy assertions
         if key == "snippy" and config['run'][key] == 1:
             if config['genotyping'][key]['flags'] != None:
                 for flag in config['genotyping'][key]['flags']:
-                    assert flag in ['unmapped'],\
-                        "unmapped is the only flag allowed in the snippy section"
+                    if flag not in ['unmapped']:
+                        raise ValueError("unmapped is the only flag allowed in the snippy section")
             if config['genotyping'][key]['options'] != None:
                 for option in config['genotyping'][key]['options']:
                     if option == "reference":
-                        assert os.path.isfile(config['genotyping'][key]['options'][option]),\
-                            "Reference value in the snippy section under genotyping section must exist."
+                        if not os.path.isfile(config['genotyping'][key]['options'][option]):
+                            raise ValueError("Reference value in the snippy section under genotyping section must exist.")
                     if option == "mapqual":
-                        assert (isinstance(config['genotyping'][key]['options'][option], int) or isinstance(config['genotyping'][key]['options'][option], float))  and  config['genotyping'][key]['options'][option] >= 0,\
-                            "mapqual values under snippy section must be integer or float and be greater or equal to 0"
+                        if not ((isinstance(config['genotyping'][key]['options'][option], int) or isinstance(config['genotyping'][key]['options'][option], float))  and  config['genotyping'][key]['options'][option] >= 0):
+                            raise ValueError("mapqual values under snippy section must be integer or float and be greater or equal to 0")
                     if option == "basequal":
-                        assert (isinstance(config['genotyping'][key]['options'][option], int) or isinstance(config['genotyping'][key]['options'][option], float))  and  config['genotyping'][key]['options'][option] >= 0,\
-                            "basequal values under snippy section must be integer or float and be greater or equal to 0"
+                        if not ((isinstance(config['genotyping'][key]['options'][option], int) or isinstance(config['genotyping'][key]['options'][option], float))  and  config['genotyping'][key]['options'][option] >= 0):
+                            raise ValueError("basequal values under snippy section must be integer or float and be greater or equal to 0")
                     if option == "mincov":
-                        assert (isinstance(config['genotyping'][key]['options'][option], int) or isinstance(config['genotyping'][key]['options'][option], float))  and  config['genotyping'][key]['options'][option] >= 0,\
-                            "mincov values under snippy section must be integer or float and be greater or equal to 0"
+                        if not ((isinstance(config['genotyping'][key]['options'][option], int) or isinstance(config['genotyping'][key]['options'][option], float))  and  config['genotyping'][key]['options'][option] >= 0):
+                            raise ValueError("mincov values under snippy section must be integer or float and be greater or equal to 0")
                     if option == "minfrac":
-                        assert (isinstance(config['genotyping'][key]['options'][option], int) or isinstance(config['genotyping'][key]['options'][option], float))  and  config['genotyping'][key]['options'][option] >= 0 and config['genotyping'][key]['options'][option] <= 1,\
-                            "minfrac values under snippy section must be integer or float and be between 0 and 1"
+                        if not ((isinstance(config['genotyping'][key]['options'][option], int) or isinstance(config['genotyping'][key]['options'][option], float))  and  config['genotyping'][key]['options'][option] >= 0 and config['genotyping'][key]['options'][option] <= 1):
+                            raise ValueError("minfrac values under snippy section must be integer or float and be between 0 and 1")
         # spotyping assertions
         if key == "spotyping" and config['run'][key] == 1:
             if config['genotyping'][key]['flags'] != None:
                 for flag in config['genotyping'][key]['flags']:
-                    assert flag in ['seq','noQuery','filter','sorted'],\
-                        "seq, noQuery, filter, and sorted are the only flag allowed in the snippy section. Please look at the original config file for formatting"
+                    if flag not in ['seq','noQuery','filter','sorted']:
+                        raise ValueError("seq, noQuery, filter, and sorted are the only flag allowed in the snippy section. Please look at the original config file for formatting")
             if config['genotyping'][key]['options'] != None:
                 for option in config['genotyping'][key]['options']:
                     if option == "swift":
-                        assert config['genotyping'][key]['options'][option] == "on" or config['genotyping'][key]['options'][option] == "off",\
-                            "Swift value in the spotyping section must be on or off." 
+                        if not (config['genotyping'][key]['options'][option] == "on" or config['genotyping'][key]['options'][option] == "off"):
+                            raise ValueError("Swift value in the spotyping section must be on or off.")
                     if option == "min":
-                        assert  isinstance(config['genotyping'][key]['options'][option], int) and config['genotyping'][key]['options'][option] >= 0,\
-                            "min value in the spotyping section must an integer and greater than 0."         
+                        if not (isinstance(config['genotyping'][key]['options'][option], int) and config['genotyping'][key]['options'][option] >= 0):
+                            raise ValueError("min value in the spotyping section must an integer and greater than 0.")
                     if option == "rmin":
-                        assert  isinstance(config['genotyping'][key]['options'][option], int) and config['genotyping'][key]['options'][option] >= 0,\
-                            "rmin value in the spotyping section must an integer and greater than 0." 
+                        if not (isinstance(config['genotyping'][key]['options'][option], int) and config['genotyping'][key]['options'][option] >= 0):
+                            raise ValueError("rmin value in the spotyping section must an integer and greater than 0.")
                     if option == "outdir":
-                        assert os.path.isdir(config['genotyping'][key]['options'][option]),\
-                            "outdir value under the spotyping section in the config file is not a real directory. If error persists, try using the full directory path"
+                        if not os.path.isdir(config['genotyping'][key]['options'][option]):
+                            raise ValueError("outdir value under the spotyping section in the config file is not a real directory. If error persists, try using the full directory path")
                     if option == "output":
-                        assert "/" not in config['genotyping'][key]['options'][option],\
-                            "Output value under the spotyping section cannot contain a forward slash."                     
+                        if "/" in config['genotyping'][key]['options'][option]:
+                            raise ValueError("Output value under the spotyping section cannot contain a forward slash.")
     # clustering section assertion
     for key in config['clustering']:
         if key == "output_prefix":
-            assert config['clustering'][key] != None,\
-                "Output_prefix value in the clustering section cannot be None."
+            if config['clustering'][key] == None:
+                raise ValueError("Output_prefix value in the clustering section cannot be None.")
         if key == "genotyping":
             if config['clustering'][key] != None:
                 for type in config['clustering'][key]:
@@ -369,64 +380,55 @@ def assert_config(config):
                     if calls_path == None:
                        continue
                     if type == 'SNP' and config['run']['snippy'] == 1:
-                        assert False,\
-                            "You've selected to run snippy in the genotyping section and supplied a list of SNP calls. Please choose only one"
+                        raise ValueError("You've selected to run snippy in the genotyping section and supplied a list of SNP calls. Please choose only one")
                     if type == 'MLST' and config['run']['mentalist'] == 1:
-                        assert False,\
-                            "You've selected to run mentalist in the genotyping section and supplied a list of MLST calls. Please choose only one"
+                        raise ValueError("You've selected to run mentalist in the genotyping section and supplied a list of MLST calls. Please choose only one")
                     if type == 'CNV' and config['run']['prince'] == 1:
-                        assert False,\
-                            "You've selected to run prince in the genotyping section and supplied a list of CNV calls. Please choose only one"
+                        raise ValueError("You've selected to run prince in the genotyping section and supplied a list of CNV calls. Please choose only one")
                     if type == 'spoligotyping' and config['run']['spotyping'] == 1:
-                        assert False,\
-                            "You've selected to run spotyping in the genotyping section and supplied a list of spoligotyping calls. Please choose only one"
-                    assert os.path.isfile(calls_path),\
-                        "File location values in the genotyping section under clustering section must exist or be empty."
+                        raise ValueError("You've selected to run spotyping in the genotyping section and supplied a list of spoligotyping calls. Please choose only one")
+                    if not os.path.isfile(calls_path):
+                        raise ValueError("File location values in the genotyping section under clustering section must exist or be empty.")
         if key == "genotyping_options":
             if config['clustering'][key]['bed_filter'] != None:
-                os.path.isfile(config['clustering'][key]['bed_filter']),\
-                    "File location values in the bed_filter section under clustering section must exist or be empty."
+                if not os.path.isfile(config['clustering'][key]['bed_filter']):
+                    raise ValueError("File location values in the bed_filter section under clustering section must exist or be empty.")
         if key == "distances":
             for type in config['clustering'][key]:
                 dist_path = config['clustering'][key][type]
                 if dist_path == None:
                    continue
                 if type == 'SNP' and config['run']['snippy'] == 1:
-                    assert False,\
-                        "You've selected to run snippy in the genotyping section and supplied a SNP distance matrix. Please choose only one"
+                    raise ValueError("You've selected to run snippy in the genotyping section and supplied a SNP distance matrix. Please choose only one")
                 if type == 'MLST' and config['run']['mentalist'] == 1:
-                    assert False,\
-                        "You've selected to run mentalist in the genotyping section and supplied a MLST distance matrix. Please choose only one"
+                    raise ValueError("You've selected to run mentalist in the genotyping section and supplied a MLST distance matrix. Please choose only one")
                 if type == 'CNV' and config['run']['prince'] == 1:
-                    assert False,\
-                        "You've selected to run prince in the genotyping section and supplied a CNV distance matrix. Please choose only one"
+                    raise ValueError("You've selected to run prince in the genotyping section and supplied a CNV distance matrix. Please choose only one")
                 if type == 'spoligotyping' and config['run']['spotyping'] == 1:
-                    assert False,\
-                        "You've selected to run spotyping in the genotyping section and supplied a spoligotyping distance matrix. Please choose only one"
+                    raise ValueError("You've selected to run spotyping in the genotyping section and supplied a spoligotyping distance matrix. Please choose only one")
                 if type == 'kWIP' and config['run']['kwip'] == 1:
-                    assert False,\
-                        "You've selected to run kwip in the genotyping section and supplied a kwip distance matrix. Please choose only one"
-                assert os.path.isfile(dist_path),\
-                    "File location values in the distances section under clustering section must exist or be empty."
+                    raise ValueError("You've selected to run kwip in the genotyping section and supplied a kwip distance matrix. Please choose only one")
+                if not os.path.isfile(dist_path):
+                    raise ValueError("File location values in the distances section under clustering section must exist or be empty.")
         if key == "fine_clusterings":
-            assert config['clustering'][key] != None,\
-                "fine_clusterings values must be a combination of at least 1 SNP, kWIP, MLST, CNV, and spoligotyping"
+            if config['clustering'][key] == None:
+                raise ValueError("fine_clusterings values must be a combination of at least 1 SNP, kWIP, MLST, CNV, and spoligotyping")
             for type in config['clustering'][key]:
-                assert type in ['SNP','kWIP','MLST','CNV','spoligotyping'],\
-                    "fine_clusterings values must be a combination of at least 1 SNP, kWIP, MLST, CNV, and spoligotyping"
+                if type not in ['SNP','kWIP','MLST','CNV','spoligotyping']:
+                    raise ValueError("fine_clusterings values must be a combination of at least 1 SNP, kWIP, MLST, CNV, and spoligotyping")
         if key == "thresholds":
             for type in config['clustering'][key]:
-                assert(isinstance(config['clustering'][key][type], int) or isinstance(config['clustering'][key][type], float))  and  config['clustering'][key][type] >= 0,\
-                    "Threshold values under clustering section must be integer or float and be greater or equal to 0"
+                if not ((isinstance(config['clustering'][key][type], int) or isinstance(config['clustering'][key][type], float))  and  config['clustering'][key][type] >= 0):
+                    raise ValueError("Threshold values under clustering section must be integer or float and be greater or equal to 0")
         if key == "all_constraints":
-            assert config['clustering'][key] == True or config['clustering'][key] == False,\
-                "all_constraints values must be either True or False"
+            if not (config['clustering'][key] == True or config['clustering'][key] == False):
+                raise ValueError("all_constraints values must be either True or False")
         if key == "method":
-            assert config['clustering'][key] == "ILP" or config['clustering'][key] == "C4",\
-                "Method values must be either ILP or c4"
+            if not (config['clustering'][key] == "ILP" or config['clustering'][key] == "C4"):
+                raise ValueError("Method values must be either ILP or c4")
         if key == "visualize":
-            assert config['clustering'][key] == True or config['clustering'][key] == False,\
-                "visualize values must be either True or False"
+            if not (config['clustering'][key] == True or config['clustering'][key] == False):
+                raise ValueError("visualize values must be either True or False")
     return 0
                     
 def get_bases_and_reads_number(fastq_path):
@@ -26,6 +26,20 @@ def visualize(distance, name, metadata = None, columns = None, save_path = None)
     '''
     distance_histogram(distance, name, save_path)
 
+def downsample_distance_matrix(distance, max_samples=2048, seed=0):
+    '''
+    Returns the distance matrix restricted to a random subset of max_samples samples (in their
+    original order), or the matrix itself if it is not larger than that.
+    The pairwise distances of a random subset follow the same distribution as all of the distances,
+    so the histogram keeps its shape while the number of distances drops to max_samples squared.
+    '''
+    num_samples = distance.shape[0]
+    if num_samples <= max_samples:
+        return distance
+    logger.debug("Downsampling distance matrix from %d to %d samples", num_samples, max_samples)
+    positions = numpy.sort(numpy.random.RandomState(seed).choice(num_samples, max_samples, replace=False))
+    return distance.iloc[positions, positions]
+
 def distance_histogram(distance, name='SAMPLE', save_path=None):
     '''
     Creates a distance histogram from the distances in the
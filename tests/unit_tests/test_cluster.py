@@ -1,16 +1,33 @@
 import numpy
 import pandas as pd
 import pandas.testing as pt
+import os
+import pickle
+import shutil
 import sys
+import tempfile
 import unittest 
+from unittest import mock
 sys.path.append('../..')
 import pathogist
 import pathogist.io
 import pathogist.cluster
 
+class UnloadablePickle(object):
+    '''
+    Pickles to a call raising ValueError when it is loaded.
+    '''
+    def __reduce__(self):
+        return (int,('not a number',))
+
 class ClusterTest(unittest.TestCase):
 
     def setUp(self):
+        # Don't read or write cached clusterings, except in the tests of the cache
+        environ = mock.patch.dict(os.environ,{'PATHOGIST_NO_CACHE': '1'})
+        environ.start()
+        self.addCleanup(environ.stop)
+
         mlst_dist_path = 'tests/unit_tests/test_data/cluster/yersinia_mlst_dist.tsv'
         snp_dist_path = 'tests/unit_tests/test_data/cluster/yersinia_snp_dist.tsv'
         kwip_dist_path = 'tests/unit_tests/test_data/cluster/yersinia_kwip_dist.tsv'
@@ -45,6 +62,50 @@ class ClusterTest(unittest.TestCase):
         pt.assert_series_equal(clustering.loc[samples,'Consensus'],
                               true_clustering.loc[samples,'Consensus'])
 
+    def test_clustering_to_start_solution(self):
+        clustering = pd.DataFrame({'Cluster': [1,2,1]},index=['A','B','C'])
+        start_solution = pathogist.cluster.clustering_to_start_solution(clustering,['C','B','A'])
+        true_solution = numpy.array([[0,1,0],[1,0,1],[0,1,0]],dtype=float)
+        numpy.testing.assert_array_equal(start_solution,true_solution)
+
+    def test_correlation_cache(self):
+        cache_home = tempfile.mkdtemp()
+        try:
+            with mock.patch.dict(os.environ,{'XDG_CACHE_HOME': cache_home,'PATHOGIST_NO_CACHE': ''}):
+                cache_dir = pathogist.cluster.correlation_cache_dir()
+                self.assertEqual(cache_dir,os.path.join(cache_home,'pathogist','corr'))
+                clustering = pathogist.cluster.correlation(self.mlst_dist,500,method='C4')
+                cache_files = os.listdir(cache_dir)
+                self.assertEqual(len(cache_files),1)
+                # A hit returns the cached clustering instead of solving the problem again
+                cached_clustering = clustering.copy()
+                cached_clustering.iloc[:,0] = 1
+                with open(os.path.join(cache_dir,cache_files[0]),'wb') as cache_file:
+                    pickle.dump(cached_clustering,cache_file)
+                pt.assert_frame_equal(pathogist.cluster.correlation(self.mlst_dist,500,method='C4'),
+                                      cached_clustering)
+                # A different threshold is a miss
+                pathogist.cluster.correlation(self.mlst_dist,400,method='C4')
+                self.assertEqual(len(os.listdir(cache_dir)),2)
+                # An entry failing to load, e.g. pickled by another pandas version, is solved again
+                # and replaced
+                with open(os.path.join(cache_dir,cache_files[0]),'wb') as cache_file:
+                    pickle.dump(UnloadablePickle(),cache_file)
+                clustering = pathogist.cluster.correlation(self.mlst_dist,500,method='C4')
+                self.assertEqual(len(clustering.index),len(self.mlst_dist.index))
+                with open(os.path.join(cache_dir,cache_files[0]),'rb') as cache_file:
+                    pt.assert_frame_equal(pickle.load(cache_file),clustering)
+        finally:
+            shutil.rmtree(cache_home)
+
+    def test_correlation_cache_disabled(self):
+        self.assertIsNone(pathogist.cluster.correlation_cache_dir())
+        # The cache directory can't be created under a file, which must not fail the clustering
+        with tempfile.NamedTemporaryFile() as cache_home:
+            with mock.patch.dict(os.environ,{'XDG_CACHE_HOME': cache_home.name,'PATHOGIST_NO_CACHE': ''}):
+                clustering = pathogist.cluster.correlation(self.mlst_dist,500,method='C4')
+        self.assertEqual(len(clustering.index),len(self.mlst_dist.index))
+
 
 """
     def test_processProblemWithPulp(self):
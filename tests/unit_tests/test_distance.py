@@ -6,7 +6,7 @@ sys.path.append('../..')
 import pathogist
 import pathogist.io
 import pathogist.distance
-from unittest import TestCase
+from unittest import TestCase, mock
 
 class DistanceTest(TestCase):
 
@@ -49,3 +49,73 @@ class DistanceTest(TestCase):
         true_matrix = true_matrix.sort_index(axis=0).sort_index(axis=1)
         distance_matrix = distance_matrix.sort_index(axis=0).sort_index(axis=1)
         pt.assert_frame_equal(true_matrix.sort_index(axis=0),distance_matrix.sort_index(axis=0))
+
+    def test_snp_distance_matrix_bases(self):
+        calls = {'A': numpy.array(['A','C','G','T','A'],dtype='S1'),
+                 'B': numpy.array(['A','C','G','T','T'],dtype='S1'),
+                 'C': numpy.array(['T','G','C','A','T'],dtype='S1')}
+        true_matrix = pd.DataFrame([[0,1,5],[1,0,4],[5,4,0]],index=['A','B','C'],columns=['A','B','C'])
+        distance_matrix = pathogist.distance.create_snp_distance_matrix(calls)
+        pt.assert_frame_equal(true_matrix,distance_matrix)
+
+    def test_snp_distance_matrix_numba(self):
+        if pathogist.distance._numba_kernels() is None:
+            self.skipTest('numba is not installed')
+        true_matrix = pathogist.distance.create_snp_distance_matrix(self.mlst_calls)
+        threshold = pathogist.distance.NUMBA_THRESHOLD
+        pathogist.distance.NUMBA_THRESHOLD = 0
+        try:
+            distance_matrix = pathogist.distance.create_snp_distance_matrix(self.mlst_calls)
+        finally:
+            pathogist.distance.NUMBA_THRESHOLD = threshold
+        pt.assert_frame_equal(true_matrix,distance_matrix)
+
+    def test_mlst_cnv_distance_matrices_numba(self):
+        if pathogist.distance._numba_kernels() is None:
+            self.skipTest('numba is not installed')
+        true_mlst_matrix = pathogist.distance.create_mlst_distance_matrix(self.mlst_calls)
+        true_cnv_matrix = pathogist.distance.create_cnv_distance_matrix(self.cnv_calls)
+        threshold = pathogist.distance.NUMBA_THRESHOLD
+        pathogist.distance.NUMBA_THRESHOLD = 0
+        try:
+            mlst_matrix = pathogist.distance.create_mlst_distance_matrix(self.mlst_calls)
+            cnv_matrix = pathogist.distance.create_cnv_distance_matrix(self.cnv_calls)
+        finally:
+            pathogist.distance.NUMBA_THRESHOLD = threshold
+        pt.assert_frame_equal(true_mlst_matrix,mlst_matrix)
+        pt.assert_frame_equal(true_cnv_matrix,cnv_matrix)
+
+    def test_encode_calls(self):
+        for dtype in ('S1','S2','S3','U1'):
+            calls = {'A': numpy.array(['A','C','A','T'],dtype=dtype),
+                     'B': numpy.array(['C','C','G','T'],dtype=dtype)}
+            samples,codes,num_values = pathogist.distance.encode_calls(calls)
+            self.assertEqual(samples,['A','B'])
+            self.assertEqual(num_values,4)
+            self.assertEqual(codes.dtype,numpy.uint8)
+            # Two calls share a code if and only if they are equal
+            stacked = numpy.array([calls['A'],calls['B']]).ravel()
+            numpy.testing.assert_array_equal(codes.ravel()[:,None] == codes.ravel()[None,:],
+                                             stacked[:,None] == stacked[None,:])
+
+    def test_one_hot_hamming_distances(self):
+        codes = numpy.random.RandomState(0).randint(0,6,size=(10,70))
+        true_distances = (codes[:,None,:] != codes[None,:,:]).sum(axis=2)
+        distances = pathogist.distance.one_hot_hamming_distances(codes,6)
+        numpy.testing.assert_array_equal(true_distances,distances)
+        # Blocks of positions give the same distances, including a last partial block
+        with mock.patch.object(pathogist.distance,'ONE_HOT_BLOCK_CALLS',80):
+            distances = pathogist.distance.one_hot_hamming_distances(codes,6)
+        numpy.testing.assert_array_equal(true_distances,distances)
+
+    def test_packed_hamming_distances(self):
+        codes = numpy.random.RandomState(0).randint(0,4,size=(10,70))
+        true_distances = pathogist.distance.one_hot_hamming_distances(codes,4)
+        packed = pathogist.distance.pack_2bit(codes)
+        self.assertEqual(packed.shape,(10,3))
+        distances = pathogist.distance.packed_hamming_distances(packed)
+        numpy.testing.assert_array_equal(true_distances,distances)
+        if pathogist.distance._numba_kernels() is not None:
+            distances = numpy.empty(shape=(10,10),dtype=int)
+            pathogist.distance._numba_kernels().packed_hamming_distances(packed,distances)
+            numpy.testing.assert_array_equal(true_distances,distances)
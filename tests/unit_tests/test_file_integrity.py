@@ -9,6 +9,7 @@ import pathogist.io
 import pathogist.cluster
 import yaml
 import os
+import copy
 
 class FileIntegrityTest(unittest.TestCase):
 
@@ -20,12 +21,34 @@ class FileIntegrityTest(unittest.TestCase):
     def test_config(self):
         with open(self.config_path,'r') as config_stream:
             try:
-                config = yaml.load(config_stream) 
+                config = yaml.load(config_stream,Loader=yaml.SafeLoader)
             except yaml.YAMLError:
                 print(yaml.YAMLError)
                 sys.exit(1)
         assert pathogist.io.assert_config(config) == 0
 
+    def test_invalid_config(self):
+        with open(self.config_path,'r') as config_stream:
+            config = yaml.load(config_stream,Loader=yaml.SafeLoader)
+        config['clustering']['genotyping_options'] = {'bed_filter': None}
+        self.assertEqual(pathogist.io.assert_config(config),0)
+        invalid_values = [(('threads',),0),
+                          (('temp',),'tests/unit_tests/test_data/missing_dir'),
+                          (('run','kwip'),2),
+                          (('clustering','method'),'ILP2'),
+                          (('clustering','thresholds','SNP'),-1),
+                          (('clustering','genotyping_options','bed_filter'),
+                           'tests/unit_tests/test_data/missing.bed')]
+        for keys,value in invalid_values:
+            invalid_config = copy.deepcopy(config)
+            section = invalid_config
+            for key in keys[:-1]:
+                section = section[key]
+            section[keys[-1]] = value
+            # ValueError rather than AssertionError, so that the checks also run with python -O
+            with self.assertRaises(ValueError,msg='%s: %s' % ('/'.join(keys),value)):
+                pathogist.io.assert_config(invalid_config)
+
     def test_fastq_input(self):
         forward_reads_paths = {}
         reverse_reads_paths = {}
@@ -49,4 +72,13 @@ class FileIntegrityTest(unittest.TestCase):
                 reverse_reads_paths[accession] = path
 
         assert pathogist.io.check_fastq_input(forward_reads_paths, reverse_reads_paths) == 0
-    
\ No newline at end of file
+    
+
+    def test_distance_file_dtype(self):
+        distance_path = 'tests/unit_tests/test_data/cluster/yersinia_mlst_dist.tsv'
+        true_matrix = pathogist.io.open_distance_file(distance_path)
+        distance_matrix = pathogist.io.open_distance_file(distance_path,dtype=numpy.float32)
+        # Only the distances are read as float32, the sample names are unchanged
+        self.assertTrue((distance_matrix.dtypes == numpy.float32).all())
+        pt.assert_index_equal(true_matrix.index,distance_matrix.index)
+        pt.assert_frame_equal(true_matrix.astype(numpy.float32),distance_matrix)
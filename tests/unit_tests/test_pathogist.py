@@ -0,0 +1,81 @@
+import importlib.machinery
+import importlib.util
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import unittest
+import pandas.testing as pt
+sys.path.append('../..')
+import pathogist
+import pathogist.io
+
+# PATHOGIST is a script without a .py extension, so it is loaded from its path
+loader = importlib.machinery.SourceFileLoader('pathogist_script','PATHOGIST')
+pathogist_script = importlib.util.module_from_spec(importlib.util.spec_from_loader(loader.name,loader))
+loader.exec_module(pathogist_script)
+
+def touch_later(path):
+    '''
+    Set the modification time of the file at path a few seconds after its current one.
+    '''
+    mtime = os.path.getmtime(path) + 5
+    os.utime(path,(mtime,mtime))
+
+class PathogistTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree,self.temp_dir)
+
+    def test_load_config_cache(self):
+        config_path = os.path.join(self.temp_dir,'config.yaml')
+        with open(config_path,'w') as config_file:
+            config_file.write('threads: 1\n')
+        self.assertEqual(pathogist_script._load_config(config_path),{'threads': 1})
+        self.assertTrue(os.path.isfile(config_path + '.json'))
+        self.assertEqual(pathogist_script._load_config(config_path),{'threads': 1})
+        # A modified configuration file is parsed again
+        with open(config_path,'w') as config_file:
+            config_file.write('threads: 2\n')
+        touch_later(config_path)
+        self.assertEqual(pathogist_script._load_config(config_path),{'threads': 2})
+        # So is a configuration file replaced by an older one, e.g. with cp -p
+        old_config_path = os.path.join(self.temp_dir,'old_config.yaml')
+        with open(old_config_path,'w') as config_file:
+            config_file.write('threads: 3\n')
+        os.utime(old_config_path,(0,0))
+        shutil.copy2(old_config_path,config_path)
+        self.assertEqual(pathogist_script._load_config(config_path),{'threads': 3})
+
+    def test_load_distance_files_cache(self):
+        mlst_path = 'tests/unit_tests/test_data/cluster/yersinia_mlst_dist.tsv'
+        snp_path = 'tests/unit_tests/test_data/cluster/yersinia_snp_dist.tsv'
+        distance_path = os.path.join(self.temp_dir,'dist.tsv')
+        shutil.copy(mlst_path,distance_path)
+        list_path = os.path.join(self.temp_dir,'distances.txt')
+        with open(list_path,'w') as list_file:
+            list_file.write('MLST=%s\n' % distance_path)
+        cache_path = list_path + '.cache.pkl'
+
+        # The disk cache is opt-in
+        distances = pathogist_script._load_distance_files(list_path)
+        self.assertFalse(os.path.exists(cache_path))
+        pt.assert_frame_equal(distances['MLST'],pathogist.io.open_distance_file(mlst_path))
+
+        distances = pathogist_script._load_distance_files(list_path,disk_cache=True)
+        self.assertTrue(os.path.isfile(cache_path))
+        # Unmodified files are read from the cache
+        with open(cache_path,'rb') as cache_file:
+            cached = pickle.load(cache_file)
+        cached['distances']['MLST'] = cached['distances']['MLST'] + 1
+        with open(cache_path,'wb') as cache_file:
+            pickle.dump(cached,cache_file)
+        distances = pathogist_script._load_distance_files(list_path,disk_cache=True)
+        pt.assert_frame_equal(distances['MLST'],pathogist.io.open_distance_file(mlst_path) + 1)
+        # A modified distance file is read again
+        shutil.copy(snp_path,distance_path)
+        touch_later(distance_path)
+        distances = pathogist_script._load_distance_files(list_path,disk_cache=True)
+        pt.assert_frame_equal(distances['MLST'],pathogist.io.open_distance_file(snp_path))
@@ -0,0 +1,35 @@
+import numpy
+import pandas as pd
+import pandas.testing as pt
+import sys
+import unittest
+sys.path.append('../..')
+import pathogist
+import pathogist.visualize
+
+class VisualizeTest(unittest.TestCase):
+
+    def distance_matrix(self,num_samples):
+        samples = ['S%d' % sample for sample in range(num_samples)]
+        positions = numpy.arange(num_samples)
+        distances = numpy.abs(positions[:,None] - positions[None,:])
+        return pd.DataFrame(distances,index=samples,columns=samples)
+
+    def test_downsample_small_distance_matrix(self):
+        for num_samples in (10,2048):
+            distance_matrix = self.distance_matrix(num_samples)
+            downsampled = pathogist.visualize.downsample_distance_matrix(distance_matrix)
+            self.assertIs(downsampled,distance_matrix)
+
+    def test_downsample_large_distance_matrix(self):
+        distance_matrix = self.distance_matrix(3000)
+        downsampled = pathogist.visualize.downsample_distance_matrix(distance_matrix)
+        self.assertEqual(downsampled.shape,(2048,2048))
+        samples = downsampled.index.tolist()
+        self.assertEqual(downsampled.columns.tolist(),samples)
+        self.assertEqual(len(set(samples)),2048)
+        # The samples are kept in their original order
+        all_samples = distance_matrix.index.tolist()
+        positions = [all_samples.index(sample) for sample in samples]
+        self.assertEqual(positions,sorted(positions))
+        pt.assert_frame_equal(downsampled,distance_matrix.loc[samples,samples])
@@ -2,4 +2,6 @@
 
 python -m unittest tests/unit_tests/test_cluster.py
 python -m unittest tests/unit_tests/test_distance.py
-python -m unittest tests/unit_tests/test_file_integrity.py
\ No newline at end of file
+python -m unittest tests/unit_tests/test_file_integrity.py
+python -m unittest tests/unit_tests/test_pathogist.py
+python -m unittest tests/unit_tests/test_visualize.py